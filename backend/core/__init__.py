@@ -15,8 +15,10 @@
 """LOCO Core Package.
 
 This package contains the core modules for the LOCO RAG Engine:
+- cache: Similarity-keyed semantic cache for query results
 - database: LanceDB connection and configuration management
 - engine: RAG engine for embeddings, ingestion, and query processing
+- pipeline: Staged ingestion pipeline overlapping chunking, embedding, and writes
 - processor: Document processing and semantic chunking
 - security: Authentication and authorization utilities
 """
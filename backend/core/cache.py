@@ -0,0 +1,149 @@
+# Copyright 2024 LOCO RAG Engine
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Semantic caching for query results.
+
+This module implements a similarity-keyed cache: instead of requiring an
+exact string match, a lookup succeeds when the cosine similarity between
+the incoming query's embedding and a cached query's embedding meets a
+threshold. Near-duplicate questions therefore reuse a prior answer and
+skip both the vector search and the LLM generation.
+
+All cached vectors are kept stacked in one contiguous float16 matrix
+(structure-of-arrays rather than one array per entry), so a lookup is a
+single matrix-vector product regardless of cache size. The scan is
+memory-bound, so halving the element width halves the bytes it streams;
+float16 keeps ~3 decimal digits, far more than the hit threshold needs.
+
+Typical usage example:
+
+    cache = SemanticCache()
+    cached = cache.lookup(q_norm)
+    if cached is None:
+        result = run_expensive_query()
+        cache.insert(q_norm, result)
+"""
+
+import threading
+import time
+from typing import Any, Optional
+
+import numpy as np
+
+
+class SemanticCache:
+    """Similarity-keyed cache of (query embedding, result) pairs.
+
+    Entries expire after a time-to-live and the oldest entry is evicted
+    once the cache is full. Callers must pass L2-normalized embeddings
+    so the dot-product scores are exact cosine similarities. All public
+    methods are thread-safe; request handlers call them from worker
+    threads concurrently.
+
+    Attributes:
+        max_size: Maximum number of cached entries.
+        threshold: Cosine similarity required for a lookup to hit.
+        ttl: Entry lifetime in seconds.
+
+    Example:
+        cache = SemanticCache(max_size=256, threshold=0.95)
+        cache.insert(q_norm, {"answer": "...", "references": []})
+        hit = cache.lookup(q_norm)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        threshold: float = 0.95,
+        ttl: float = 300.0,
+    ) -> None:
+        """Initialize the semantic cache.
+
+        Args:
+            max_size: Maximum number of entries. Defaults to 256.
+            threshold: Cosine similarity threshold for hits.
+                Defaults to 0.95.
+            ttl: Entry lifetime in seconds. Defaults to 300.
+        """
+        self.max_size = max_size
+        self.threshold = threshold
+        self.ttl = ttl
+        # Stacked (N, dim) float16 matrix of cached query embeddings
+        self._vecs: Optional[np.ndarray] = None
+        self._entries: list[tuple[float, dict[str, Any]]] = []
+        # Guards _vecs/_entries, which must stay row-aligned; lookups
+        # and inserts arrive from concurrent worker threads
+        self._lock = threading.Lock()
+
+    def lookup(self, q_norm: np.ndarray) -> Optional[dict[str, Any]]:
+        """Look up a cached result for a semantically similar query.
+
+        Args:
+            q_norm: The L2-normalized query embedding.
+
+        Returns:
+            The cached result, or None on a miss or expired entry.
+        """
+        with self._lock:
+            if self._vecs is None or not self._entries:
+                return None
+
+            scores = self._vecs @ q_norm.astype(np.float16)
+            best = int(np.argmax(scores))
+
+            if scores[best] < self.threshold:
+                return None
+
+            inserted_at, result = self._entries[best]
+            if time.monotonic() - inserted_at > self.ttl:
+                self._evict(best)
+                return None
+
+            return result
+
+    def insert(self, q_norm: np.ndarray, result: dict[str, Any]) -> None:
+        """Insert a query result, evicting the oldest entry when full.
+
+        Args:
+            q_norm: The L2-normalized query embedding.
+            result: The result to cache for similar queries.
+        """
+        row = q_norm.astype(np.float16).reshape(1, -1)
+        with self._lock:
+            if self._vecs is None:
+                self._vecs = row
+            else:
+                self._vecs = np.vstack([self._vecs, row])
+            self._entries.append((time.monotonic(), result))
+
+            if len(self._entries) > self.max_size:
+                self._evict(0)
+
+    def clear(self) -> None:
+        """Drop all cached entries.
+
+        Call this whenever the underlying knowledge base changes, since
+        cached answers may no longer reflect the stored documents.
+        """
+        with self._lock:
+            self._vecs = None
+            self._entries = []
+
+    def _evict(self, index: int) -> None:
+        """Remove the entry at the given index. Caller holds the lock."""
+        self._entries.pop(index)
+        if len(self._entries) == 0:
+            self._vecs = None
+        else:
+            self._vecs = np.delete(self._vecs, index, axis=0)
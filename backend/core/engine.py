@@ -33,11 +33,36 @@ Typical usage example:
     print(result["references"])
 """
 
-from typing import Any, Optional
+import asyncio
+import hashlib
+import random
+import threading
+from collections import OrderedDict
+from typing import Any, Iterator, Optional
 
+import numpy as np
 import ollama
+import pyarrow as pa
 
-from backend.core.database import get_lancedb_connection, load_config
+from backend.core.cache import SemanticCache
+from backend.core.database import get_lancedb_connection, load_config, save_config
+
+# Static halves of the augmented prompt, built once at import time so
+# each query only concatenates the dynamic context and question
+_PROMPT_PREFIX = """Use the provided context to answer the question.
+If the answer is not in the context, say you don't know.
+Provide citations like [Source: filename].
+
+Context:
+"""
+_PROMPT_SUFFIX = """
+
+Question: {q}
+
+Answer:"""
+
+# Explicitly use 127.0.0.1 to avoid issues with OLLAMA_HOST=0.0.0.0
+_OLLAMA_HOST = "http://127.0.0.1:11434"
 
 
 class LocoEngine:
@@ -58,7 +83,31 @@ class LocoEngine:
     """
     
     TABLE_NAME = "doc_store"
-    
+
+    # Maximum number of embeddings kept in the in-memory cache
+    EMBEDDING_CACHE_SIZE = 4096
+
+    # Semantic query cache: answers are reused for queries whose cosine
+    # similarity to a cached query meets the threshold, until they expire
+    QUERY_CACHE_SIZE = 256
+    QUERY_CACHE_THRESHOLD = 0.95
+    QUERY_CACHE_TTL = 300.0
+
+    # ANN index thresholds: build once the flat scan starts to hurt,
+    # then rebuild after this many additional rows
+    INDEX_MIN_ROWS = 2048
+    INDEX_REBUILD_ROWS = 10_000
+
+    # Keep models resident in Ollama between requests; the default
+    # 5-minute idle unload causes multi-second reload spikes
+    KEEP_ALIVE = "24h"
+
+    # ANN search tuning (only takes effect once the index exists):
+    # probe more partitions for recall, then re-rank the candidates
+    # against the original float32 vectors to undo PQ quantization loss
+    SEARCH_NPROBES = 20
+    SEARCH_REFINE_FACTOR = 4
+
     def __init__(self) -> None:
         """Initialize the LOCO RAG engine.
         
@@ -68,31 +117,240 @@ class LocoEngine:
         """
         self.db = get_lancedb_connection()
         self.config = load_config()
-        # Explicitly use 127.0.0.1 to avoid issues with OLLAMA_HOST=0.0.0.0
-        self.client = ollama.Client(host='http://127.0.0.1:11434')
+        # The sync client wraps a persistent httpx connection pool, so
+        # keeping one for the engine's lifetime reuses TCP connections
+        # (keep-alive) instead of re-handshaking per request. The async
+        # client is the same but for coroutines on the server's event
+        # loop; it must only ever be used from that one long-lived loop,
+        # because its pooled connections are bound to the loop they were
+        # opened on.
+        self.client = ollama.Client(host=_OLLAMA_HOST)
+        self.async_client = ollama.AsyncClient(host=_OLLAMA_HOST)
+        # LRU cache of (model, content hash) -> embedding array. Repeated
+        # chunks (boilerplate headers/footers, re-ingested documents) and
+        # repeated queries skip the Ollama round-trip entirely.
+        self._embedding_cache: OrderedDict[tuple[str, str], np.ndarray] = (
+            OrderedDict()
+        )
+        # Guards the LRU bookkeeping above; get_embeddings runs in many
+        # worker threads at once during ingestion
+        self._embedding_cache_lock = threading.Lock()
+        # Semantic query cache: near-duplicate queries reuse a recent
+        # answer and skip retrieval plus LLM generation entirely
+        self._qcache = SemanticCache(
+            max_size=self.QUERY_CACHE_SIZE,
+            threshold=self.QUERY_CACHE_THRESHOLD,
+            ttl=self.QUERY_CACHE_TTL,
+        )
+        # Lazily opened LanceDB table handle; opening a table reads
+        # manifest metadata from disk, so do it once and reuse
+        self._table: Optional[Any] = None
+
+    def _get_table(self) -> Any:
+        """Open the document table once and reuse the handle.
+
+        Returns:
+            The LanceDB table handle for TABLE_NAME.
+        """
+        if self._table is None:
+            self._table = self.db.open_table(self.TABLE_NAME)
+        return self._table
     
-    def get_embedding(self, text: str) -> list[float]:
+    def get_embedding(self, text: str) -> np.ndarray:
         """Generate a vector embedding for the given text.
-        
+
         Uses the Ollama embedding model specified in the configuration to
-        convert text into a high-dimensional vector representation.
-        
+        convert text into a high-dimensional vector representation. This is
+        a convenience wrapper around get_embeddings for single texts.
+
         Args:
             text: The input text to embed.
-            
+
         Returns:
-            A list of floats representing the embedding vector.
-            
+            A float32 numpy array representing the embedding vector.
+
         Raises:
             ollama.ResponseError: If the Ollama API request fails.
-            
+
         Example:
             embedding = engine.get_embedding("Hello, world!")
             print(f"Embedding dimension: {len(embedding)}")
         """
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+    ) -> list[np.ndarray]:
+        """Generate vector embeddings for a batch of texts.
+
+        Sends texts to Ollama's batch embedding endpoint in sub-batches,
+        so N texts cost ceil(N / batch_size) HTTP round-trips instead of N.
+        This makes ingestion network-efficient: the per-request overhead is
+        amortized across the whole batch.
+
+        Vectors are returned as float32 numpy arrays rather than Python
+        float lists: a 768-dim float32 array is ~3 KB versus ~22 KB of
+        boxed floats, and LanceDB stores it without per-element
+        conversion.
+
+        Args:
+            texts: The input texts to embed.
+            batch_size: Maximum number of texts per Ollama request.
+                Defaults to 32.
+
+        Returns:
+            A list of float32 embedding vectors, one per input text, in
+            order.
+
+        Raises:
+            ollama.ResponseError: If the Ollama API request fails.
+
+        Example:
+            embeddings = engine.get_embeddings(["First chunk", "Second chunk"])
+            print(f"Got {len(embeddings)} embeddings")
+        """
         model = self.config.get("embedding_model", "nomic-embed-text")
-        response = self.client.embeddings(model=model, prompt=text)
-        return response["embedding"]
+
+        # Serve cache hits first; only misses go over the network. The
+        # lookup and recency update must be one atomic step, or an
+        # eviction from another thread can land in between.
+        keys = [self._cache_key(model, text) for text in texts]
+        embeddings: list[Optional[np.ndarray]] = []
+        misses: list[int] = []
+        with self._embedding_cache_lock:
+            for i, key in enumerate(keys):
+                cached = self._embedding_cache.get(key)
+                if cached is not None:
+                    self._embedding_cache.move_to_end(key)
+                    embeddings.append(cached)
+                else:
+                    embeddings.append(None)
+                    misses.append(i)
+
+        if misses:
+            fetched = self._fetch_embeddings(
+                [texts[i] for i in misses], batch_size
+            )
+            for i, embedding in zip(misses, fetched):
+                embeddings[i] = embedding
+                self._cache_put(keys[i], embedding)
+
+        return embeddings
+
+    def _cache_key(self, model: str, text: str) -> tuple[str, str]:
+        """Build an embedding cache key from the model and content hash."""
+        digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        return (model, digest)
+
+    def _cache_put(self, key: tuple[str, str], embedding: np.ndarray) -> None:
+        """Store an embedding in the LRU cache, evicting the oldest entry."""
+        with self._embedding_cache_lock:
+            self._embedding_cache[key] = embedding
+            if len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+
+    def _fetch_embeddings(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+    ) -> list[np.ndarray]:
+        """Fetch embeddings from Ollama, bypassing the cache."""
+        model = self.config.get("embedding_model", "nomic-embed-text")
+
+        batches = [
+            texts[start:start + batch_size]
+            for start in range(0, len(texts), batch_size)
+        ]
+
+        # Dispatch multiple batches concurrently when possible; fall back
+        # to sequential requests if we're already inside an event loop.
+        if len(batches) > 1:
+            try:
+                return asyncio.run(
+                    self._aget_embeddings_batched(texts, batch_size=batch_size)
+                )
+            except RuntimeError:
+                pass
+
+        embeddings: list[np.ndarray] = []
+        for sub_batch in batches:
+            response = self.client.embed(
+                model=model, input=sub_batch, keep_alive=self.KEEP_ALIVE
+            )
+            embeddings.extend(
+                np.asarray(vec, dtype=np.float32)
+                for vec in response["embeddings"]
+            )
+
+        return embeddings
+
+    async def _aget_embeddings_batched(
+        self,
+        chunks: list[str],
+        batch_size: int = 32,
+        max_concurrency: int = 4,
+    ) -> list[np.ndarray]:
+        """Generate embeddings for chunks with concurrent batch dispatch.
+
+        Splits chunks into batches and fires up to max_concurrency Ollama
+        requests in flight at once, so the total wall time approaches the
+        latency of the slowest batch rather than the sum of all batches.
+        A small random jitter before each dispatch avoids hammering Ollama
+        with perfectly synchronized requests.
+
+        Args:
+            chunks: The texts to embed.
+            batch_size: Maximum number of texts per Ollama request.
+                Defaults to 32.
+            max_concurrency: Maximum number of in-flight requests.
+                Defaults to 4.
+
+        Returns:
+            A list of float32 embedding vectors, one per input chunk, in
+            order.
+
+        Raises:
+            ollama.ResponseError: If any Ollama API request fails.
+        """
+        model = self.config.get("embedding_model", "nomic-embed-text")
+        # A fresh client per invocation: this coroutine runs under
+        # asyncio.run() on short-lived loops in worker threads, and httpx
+        # connections are bound to the loop they were opened on. Sharing
+        # a client across runs would hand later runs connections owned
+        # by a closed loop (and race the pool across concurrent loops).
+        client = ollama.AsyncClient(host=_OLLAMA_HOST)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def embed_batch(sub_batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                # Jitter dispatch slightly to avoid a thundering herd
+                await asyncio.sleep(random.random() * 0.01)
+                response = await client.embed(
+                    model=model, input=sub_batch, keep_alive=self.KEEP_ALIVE
+                )
+                return response["embeddings"]
+
+        try:
+            tasks = [
+                asyncio.create_task(embed_batch(chunks[start:start + batch_size]))
+                for start in range(0, len(chunks), batch_size)
+            ]
+            results = await asyncio.gather(*tasks)
+        finally:
+            # Close the pool before asyncio.run tears this loop down, or
+            # its open sockets are abandoned to the garbage collector.
+            # ollama.AsyncClient exposes no aclose of its own; _client is
+            # the wrapped httpx.AsyncClient.
+            await client._client.aclose()
+
+        # Flatten batch results, preserving input order
+        return [
+            np.asarray(embedding, dtype=np.float32)
+            for batch in results
+            for embedding in batch
+        ]
     
     def ingest(
         self,
@@ -128,25 +386,117 @@ class LocoEngine:
         if "filename" not in metadata:
             raise ValueError("Metadata must include 'filename' key")
         
-        # Build data records with embeddings
-        data = []
-        for i, chunk in enumerate(chunks):
-            embedding = self.get_embedding(chunk)
-            data.append({
-                "vector": embedding,
-                "text": chunk,
-                "source": metadata["filename"],
-                "page": metadata.get("page", i),
-            })
-        
+        # Embed all chunks in one batched pass; storage, normalization,
+        # and cache/index maintenance are shared with the batch pipeline
+        embeddings = self.get_embeddings(chunks)
+        vectors = np.stack(embeddings)
+        n = len(chunks)
+
+        if "page" in metadata:
+            pages = [int(metadata["page"])] * n
+        else:
+            pages = list(range(n))
+
+        return self._store_vectors(
+            chunks, vectors, [metadata["filename"]] * n, pages
+        )
+
+    def _store_vectors(
+        self,
+        chunks: list[str],
+        vectors: np.ndarray,
+        sources: list[str],
+        pages: list[int],
+    ) -> int:
+        """Normalize and write records, then invalidate derived state.
+
+        Shared tail of every ingestion path: unit-normalizes the vectors,
+        assembles a columnar Arrow table (LanceDB ingests this directly
+        without walking Python dicts to infer row-by-row types), creates
+        or appends to the document table, drops now-stale cached answers,
+        and builds the ANN index once the table has grown enough.
+
+        Args:
+            chunks: Chunk texts, one per row.
+            vectors: An (N, dim) embedding matrix. Normalized in place
+                when already float32, so callers must own the array.
+            sources: Source filename for each row.
+            pages: Page number (or chunk ordinal) for each row.
+
+        Returns:
+            The number of rows written.
+        """
+        vectors = vectors.astype(np.float32, copy=False)
+        # Unit-normalize once at ingest; cosine similarity on unit
+        # vectors reduces to a plain dot product at search time, so the
+        # per-vector norm is paid here rather than on every query
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+        n, dim = vectors.shape
+
+        data = pa.Table.from_arrays(
+            [
+                pa.FixedSizeListArray.from_arrays(pa.array(vectors.ravel()), dim),
+                pa.array(chunks, type=pa.string()),
+                pa.array(sources, type=pa.string()),
+                pa.array(pages, type=pa.int32()),
+            ],
+            names=["vector", "text", "source", "page"],
+        )
+
         # Create or append to table
         if self.TABLE_NAME not in self.db.table_names():
-            self.db.create_table(self.TABLE_NAME, data=data)
+            self._table = self.db.create_table(self.TABLE_NAME, data=data)
         else:
-            table = self.db.open_table(self.TABLE_NAME)
-            table.add(data)
-        
-        return len(data)
+            self._get_table().add(data)
+
+        # Cached answers may be stale now that the knowledge base changed
+        self._qcache.clear()
+
+        self._maybe_create_index()
+
+        return n
+
+    def _maybe_create_index(self) -> None:
+        """Build or rebuild the ANN index when the table is large enough.
+
+        An unindexed LanceDB table answers searches with a flat O(N) scan
+        over every stored vector. Once the table passes INDEX_MIN_ROWS,
+        build an IVF_PQ index so searches become sub-linear; rebuild only
+        after INDEX_REBUILD_ROWS more rows have been added so we don't
+        re-index on every ingest. The row count at the last build is
+        tracked in the config file.
+        """
+        rows = self._get_table().count_rows()
+        if rows < self.INDEX_MIN_ROWS:
+            return
+
+        indexed_rows = self.config.get("indexed_rows", 0)
+        if indexed_rows and rows - indexed_rows < self.INDEX_REBUILD_ROWS:
+            return
+
+        # Size product quantization from the stored vector dimensionality:
+        # one sub-vector per pair of dimensions compresses each vector to
+        # dim/2 bytes in the index (vs 4*dim bytes of float32), so the
+        # search kernel stays cache-resident as the table grows
+        try:
+            dim = self._get_table().schema.field("vector").type.list_size
+            num_sub_vectors = max(1, dim // 2)
+        except Exception:
+            num_sub_vectors = 16
+
+        try:
+            self._get_table().create_index(
+                metric="cosine",
+                num_partitions=256,
+                num_sub_vectors=num_sub_vectors,
+                vector_column_name="vector",
+            )
+        except Exception as e:
+            print(f"Error creating vector index: {e}")
+            return
+
+        self.config["indexed_rows"] = rows
+        save_config(self.config)
     
     def query(
         self,
@@ -189,39 +539,94 @@ class LocoEngine:
         if top_k is None:
             top_k = self.config.get("top_k", 3)
         
-        # Generate query embedding and search
-        table = self.db.open_table(self.TABLE_NAME)
+        # Generate query embedding and check the semantic cache first:
+        # a near-duplicate of a recent query skips both the vector
+        # search and the (far more expensive) LLM generation
         query_embedding = self.get_embedding(user_input)
-        
-        results = table.search(query_embedding).limit(top_k).to_list()
-        
-        # Build context from retrieved chunks
-        context = "\n---\n".join([r["text"] for r in results])
-        
-        # Construct augmented prompt
-        prompt = f"""Use the provided context to answer the question. 
-If the answer is not in the context, say you don't know.
-Provide citations like [Source: filename].
+        # Copy before normalizing so the cached embedding stays unscaled
+        q_norm = np.array(query_embedding, dtype=np.float32)
+        q_norm /= np.linalg.norm(q_norm) + 1e-12
 
-Context:
-{context}
+        cached = self._qcache.lookup(q_norm)
+        if cached is not None:
+            return cached
 
-Question: {user_input}
+        # Consume the streaming pipeline and assemble the full answer
+        references: list[dict[str, Any]] = []
+        parts: list[str] = []
+        for event in self.query_stream(user_input, top_k):
+            if "references" in event:
+                references = event["references"]
+            else:
+                parts.append(event["token"])
 
-Answer:"""
-        
-        # Generate response using LLM
-        model = self.config.get("model", "llama3.2")
-        temperature = self.config.get("temperature", 0.7)
-        
-        response = self.client.generate(
-            model=model,
-            prompt=prompt,
-            options={"temperature": temperature},
-            stream=False,
+        result = {
+            "answer": "".join(parts),
+            "references": references,
+        }
+        self._qcache.insert(q_norm, result)
+        return result
+
+    def query_stream(
+        self,
+        user_input: str,
+        top_k: Optional[int] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Query the knowledge base, streaming the answer as it generates.
+
+        Performs the same retrieval as query, but yields the LLM response
+        incrementally so callers can show tokens as soon as generation
+        starts instead of waiting for the full answer. The first yielded
+        event carries the source references; every subsequent event
+        carries one token of the answer.
+
+        Args:
+            user_input: The user's question or query.
+            top_k: Number of relevant chunks to retrieve. Defaults to the
+                value in configuration (default: 3).
+
+        Yields:
+            First a {"references": [...]} event, then {"token": str}
+            events as response fragments arrive from the LLM.
+
+        Raises:
+            ValueError: If the document store is empty.
+            ollama.ResponseError: If the LLM request fails.
+
+        Example:
+            for event in engine.query_stream("What is the main topic?"):
+                if "token" in event:
+                    print(event["token"], end="", flush=True)
+        """
+        if self.TABLE_NAME not in self.db.table_names():
+            raise ValueError(
+                "No documents in the knowledge base. Please ingest documents first."
+            )
+
+        if top_k is None:
+            top_k = self.config.get("top_k", 3)
+
+        # Normalize the query the same way as stored vectors (copying so
+        # the cached embedding stays unscaled)
+        q_vec = np.array(self.get_embedding(user_input), dtype=np.float32)
+        q_vec /= np.linalg.norm(q_vec) + 1e-12
+
+        table = self._get_table()
+        results = (
+            table.search(q_vec)
+            .nprobes(self.SEARCH_NPROBES)
+            .refine_factor(self.SEARCH_REFINE_FACTOR)
+            .limit(top_k)
+            .to_list()
         )
-        
-        # Build references list
+
+        # Build context from retrieved chunks and assemble the prompt
+        # around the precomputed static halves
+        context = "\n---\n".join(r["text"] for r in results)
+        prompt = _PROMPT_PREFIX + context + _PROMPT_SUFFIX.format(q=user_input)
+
+        # Emit references before generation so the UI can render sources
+        # while tokens stream in
         references = [
             {
                 "source": r["source"],
@@ -230,12 +635,69 @@ Answer:"""
             }
             for r in results
         ]
-        
-        return {
-            "answer": response["response"],
-            "references": references,
-        }
-    
+        yield {"references": references}
+
+        # Stream the response from the LLM token by token
+        model = self.config.get("model", "llama3.2")
+        temperature = self.config.get("temperature", 0.7)
+
+        stream = self.client.generate(
+            model=model,
+            prompt=prompt,
+            options={"temperature": temperature},
+            keep_alive=self.KEEP_ALIVE,
+            stream=True,
+        )
+        for chunk in stream:
+            token = chunk.get("response", "")
+            if token:
+                yield {"token": token}
+
+    def apply_config(self, config: dict[str, Any]) -> None:
+        """Apply an already-loaded configuration snapshot.
+
+        Callers that have just saved a config dict pass it here instead
+        of having the engine re-read it from disk; the engine keeps the
+        snapshot in memory and consults it on every request, so updates
+        take effect immediately with zero additional I/O.
+
+        Args:
+            config: The configuration dictionary to apply.
+
+        Example:
+            save_config(config)
+            engine.apply_config(config)
+        """
+        self.config = config
+        # Model or retrieval settings may have changed; cached answers
+        # could reflect the old configuration
+        self._qcache.clear()
+
+    def warm_up(self) -> None:
+        """Load the embedding and generation models into Ollama.
+
+        The first request after server start otherwise pays the cold
+        model load (seconds of disk/VRAM transfer). Calling this at
+        startup moves that cost off the user-facing path, and the
+        keep_alive passed on every request keeps the models resident
+        afterwards.
+
+        Raises:
+            ollama.ResponseError: If Ollama rejects the warmup requests.
+
+        Example:
+            engine.warm_up()
+        """
+        self.get_embedding("warmup")
+
+        model = self.config.get("model", "llama3.2")
+        self.client.generate(
+            model=model,
+            prompt="ping",
+            keep_alive=self.KEEP_ALIVE,
+            stream=False,
+        )
+
     def get_document_count(self) -> int:
         """Get the total number of document chunks in the database.
         
@@ -249,8 +711,7 @@ Answer:"""
         if self.TABLE_NAME not in self.db.table_names():
             return 0
         
-        table = self.db.open_table(self.TABLE_NAME)
-        return table.count_rows()
+        return self._get_table().count_rows()
 
     def list_documents(self) -> list[dict[str, Any]]:
         """List all documents in the knowledge base.
@@ -265,7 +726,7 @@ Answer:"""
         if self.TABLE_NAME not in self.db.table_names():
             return []
         
-        table = self.db.open_table(self.TABLE_NAME)
+        table = self._get_table()
         # LanceDB doesn't have a direct "group by" in the basic API, 
         # but we can query all unique 'source' fields.
         # For efficiency in a real prod system, we might maintain a separate 'documents' table.
@@ -298,8 +759,10 @@ Answer:"""
             return True
             
         try:
-            table = self.db.open_table(self.TABLE_NAME)
+            table = self._get_table()
             table.delete(f"source = '{filename}'")
+            # Cached answers may cite the document that was just removed
+            self._qcache.clear()
             return True
         except Exception as e:
             print(f"Error deleting document {filename}: {e}")
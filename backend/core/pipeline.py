@@ -0,0 +1,244 @@
+# Copyright 2024 LOCO RAG Engine
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pipelined document ingestion for the LOCO RAG Engine.
+
+This module implements a staged ingestion pipeline that overlaps the
+three phases of ingestion instead of running them as a strict barrier:
+
+    extract/chunk (CPU)  ->  embed (network)  ->  upsert (disk I/O)
+
+The stages are connected by bounded asyncio queues, so while one
+document's chunks are being embedded, the next document is already
+being extracted and previously embedded records are being written to
+LanceDB. For multi-document ingestion this hides the slowest stage's
+latency behind the others.
+
+Typical usage example:
+
+    pipeline = IngestionPipeline(engine)
+    total = asyncio.run(pipeline.run([("report.pdf", pdf_bytes)]))
+    print(f"Ingested {total} chunks")
+"""
+
+import asyncio
+from typing import Any
+
+import numpy as np
+
+from backend.core.processor import extract_text_from_pdf, semantic_chunking
+
+# Sentinel signalling the end of a queue's stream
+_DONE = object()
+
+
+class IngestionPipeline:
+    """Staged ingestion pipeline with bounded queues between stages.
+
+    Runs three concurrent stages: a producer that extracts and chunks
+    documents, an embedder that drains chunks in batches and calls the
+    Ollama batch embedding endpoint, and an upserter that accumulates
+    records and writes them in large batches. Writes go through the
+    engine's shared storage path, so they get the same vector
+    normalization, cache invalidation, and index maintenance as
+    single-document ingestion.
+
+    The pipeline must run on the server's long-lived event loop: the
+    embed stage reuses the engine's async client, whose pooled
+    connections are bound to that loop. Stages run under a TaskGroup,
+    so a failure in any stage cancels the others instead of leaving
+    them blocked on a queue nobody drains.
+
+    The embedding batch size and the upsert batch size are deliberately
+    separate: embedding batches are sized for Ollama request latency,
+    while upsert batches are sized to amortize LanceDB write overhead.
+
+    Attributes:
+        engine: The LocoEngine instance providing DB access and config.
+        embed_batch_size: Number of chunks per Ollama embedding request.
+        upsert_batch_size: Number of records per LanceDB write.
+
+    Example:
+        pipeline = IngestionPipeline(engine)
+        count = asyncio.run(pipeline.run([("doc.pdf", pdf_bytes)]))
+    """
+
+    def __init__(
+        self,
+        engine: Any,
+        embed_batch_size: int = 32,
+        upsert_batch_size: int = 256,
+        queue_size: int = 4,
+    ) -> None:
+        """Initialize the ingestion pipeline.
+
+        Args:
+            engine: A LocoEngine instance.
+            embed_batch_size: Chunks per embedding request. Defaults to 32.
+            upsert_batch_size: Records per LanceDB write. Defaults to 256.
+            queue_size: Maximum items buffered between stages. Defaults
+                to 4, which bounds memory while keeping all stages busy.
+        """
+        self.engine = engine
+        self.embed_batch_size = embed_batch_size
+        self.upsert_batch_size = upsert_batch_size
+        self._queue_size = queue_size
+
+    async def run(self, documents: list[tuple[str, bytes]]) -> int:
+        """Ingest documents through the three-stage pipeline.
+
+        Args:
+            documents: List of (filename, pdf_bytes) tuples to ingest.
+
+        Returns:
+            The total number of chunks ingested across all documents.
+
+        Raises:
+            ValueError: If a document cannot be parsed or chunked.
+            ollama.ResponseError: If embedding generation fails.
+        """
+        chunk_queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        record_queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+
+        # TaskGroup cancels the sibling stages when one raises; a plain
+        # gather would leave the producer blocked forever on a full
+        # queue after the consumer died
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._produce(documents, chunk_queue))
+            tg.create_task(self._embed(chunk_queue, record_queue))
+            upsert_task = tg.create_task(self._upsert(record_queue))
+        return upsert_task.result()
+
+    async def _produce(
+        self,
+        documents: list[tuple[str, bytes]],
+        chunk_queue: asyncio.Queue,
+    ) -> None:
+        """Extract text and chunk each document, feeding the chunk queue.
+
+        Extraction and chunking are CPU-bound, so they run in a worker
+        thread to keep the event loop free for the embed/upsert stages.
+        """
+        try:
+            for filename, file_bytes in documents:
+                pages = await asyncio.to_thread(
+                    extract_text_from_pdf, file_bytes
+                )
+                full_text = "\n\n".join([p["text"] for p in pages])
+                chunks = await asyncio.to_thread(
+                    semantic_chunking, full_text, self.engine.get_embeddings
+                )
+                for start in range(0, len(chunks), self.embed_batch_size):
+                    batch = chunks[start:start + self.embed_batch_size]
+                    # Carry the chunk offset so row numbering stays
+                    # continuous per document across batches
+                    await chunk_queue.put((filename, batch, start))
+        finally:
+            self._put_sentinel(chunk_queue)
+
+    async def _embed(
+        self,
+        chunk_queue: asyncio.Queue,
+        record_queue: asyncio.Queue,
+    ) -> None:
+        """Drain chunk batches and embed them via Ollama's batch endpoint."""
+        model = self.engine.config.get("embedding_model", "nomic-embed-text")
+        # Reuse the engine's async client and its keep-alive connections
+        client = self.engine.async_client
+
+        try:
+            while True:
+                item = await chunk_queue.get()
+                if item is _DONE:
+                    break
+
+                filename, batch, start = item
+                response = await client.embed(
+                    model=model, input=batch, keep_alive=self.engine.KEEP_ALIVE
+                )
+
+                records = [
+                    {
+                        "vector": np.asarray(embedding, dtype=np.float32),
+                        "text": chunk,
+                        "source": filename,
+                        "page": start + i,
+                    }
+                    for i, (chunk, embedding) in enumerate(
+                        zip(batch, response["embeddings"])
+                    )
+                ]
+                await record_queue.put(records)
+        finally:
+            self._put_sentinel(record_queue)
+
+    async def _upsert(self, record_queue: asyncio.Queue) -> int:
+        """Accumulate records and write them to LanceDB in large batches.
+
+        Returns:
+            The total number of records written.
+        """
+        pending: list[dict[str, Any]] = []
+        total = 0
+
+        while True:
+            item = await record_queue.get()
+            if item is _DONE:
+                break
+
+            pending.extend(item)
+            if len(pending) >= self.upsert_batch_size:
+                total += await asyncio.to_thread(self._write, pending)
+                pending = []
+
+        if pending:
+            total += await asyncio.to_thread(self._write, pending)
+
+        return total
+
+    @staticmethod
+    def _put_sentinel(queue: asyncio.Queue) -> None:
+        """Signal end-of-stream without ever blocking.
+
+        Runs from finally blocks, including while the stage is being
+        cancelled, so it must not await. If the queue is full, the
+        consumer is dead or dying and its buffered items will never be
+        read, so one is dropped to make room for the sentinel.
+        """
+        while True:
+            try:
+                queue.put_nowait(_DONE)
+                return
+            except asyncio.QueueFull:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+
+    def _write(self, records: list[dict[str, Any]]) -> int:
+        """Write a batch of records through the engine's storage path.
+
+        Delegating to LocoEngine keeps the pipeline's rows under the
+        same invariants as engine.ingest: unit-normalized vectors, the
+        semantic cache invalidated, and the ANN index maintained.
+
+        Returns:
+            The number of records written.
+        """
+        return self.engine._store_vectors(
+            [r["text"] for r in records],
+            np.stack([r["vector"] for r in records]),
+            [r["source"] for r in records],
+            [r["page"] for r in records],
+        )
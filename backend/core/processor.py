@@ -30,15 +30,21 @@ Typical usage example:
     pages = extract_text_from_pdf(pdf_bytes)
     
     # Chunk semantically
-    chunks = semantic_chunking(full_text, get_embedding_fn)
+    chunks = semantic_chunking(full_text, get_embeddings_fn)
 """
 
+import re
 from io import BytesIO
 from typing import Callable
 
 import numpy as np
 from pypdf import PdfReader
-from sklearn.metrics.pairwise import cosine_similarity
+
+# Sentence boundary: whitespace after terminal punctuation, followed by a
+# capital letter. Unlike splitting on ". ", this does not break on
+# abbreviations like "Dr." or "U.S." followed by lowercase text, and it
+# keeps each sentence's terminal punctuation attached.
+_SENT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
 
 
 def extract_text_from_pdf(file_bytes: bytes) -> list[dict[str, any]]:
@@ -68,7 +74,42 @@ def extract_text_from_pdf(file_bytes: bytes) -> list[dict[str, any]]:
         reader = PdfReader(BytesIO(file_bytes))
     except Exception as e:
         raise ValueError(f"Failed to read PDF: {e}") from e
-    
+
+    return _extract_pages(reader)
+
+
+def extract_text_from_pdf_path(path: str) -> list[dict[str, any]]:
+    """Extract text from a PDF file on disk.
+
+    Like extract_text_from_pdf, but reads the file lazily from disk
+    instead of requiring the whole document in memory first, so large
+    uploads can be spooled to a temporary file and processed without
+    doubling peak memory.
+
+    Args:
+        path: Filesystem path to the PDF file.
+
+    Returns:
+        A list of dictionaries, each containing:
+            - text: The extracted text content.
+            - page: The 1-indexed page number.
+
+    Raises:
+        ValueError: If the file is not a valid PDF.
+
+    Example:
+        pages = extract_text_from_pdf_path("/tmp/upload.pdf")
+    """
+    try:
+        reader = PdfReader(path)
+    except Exception as e:
+        raise ValueError(f"Failed to read PDF: {e}") from e
+
+    return _extract_pages(reader)
+
+
+def _extract_pages(reader: PdfReader) -> list[dict[str, any]]:
+    """Collect non-empty page texts from an open PdfReader."""
     pages = []
     for i, page in enumerate(reader.pages, start=1):
         text = page.extract_text()
@@ -77,13 +118,13 @@ def extract_text_from_pdf(file_bytes: bytes) -> list[dict[str, any]]:
                 "text": text.strip(),
                 "page": i,
             })
-    
+
     return pages
 
 
 def semantic_chunking(
     text: str,
-    get_embedding_fn: Callable[[str], list[float]],
+    get_embeddings_fn: Callable[[list[str]], list[list[float]]],
     threshold: float = 0.7,
     min_chunk_size: int = 100,
 ) -> list[str]:
@@ -98,70 +139,68 @@ def semantic_chunking(
     
     Args:
         text: The input text to chunk.
-        get_embedding_fn: A function that takes a string and returns an
-            embedding vector as a list of floats.
+        get_embeddings_fn: A function that takes a list of strings and
+            returns one embedding vector per string, in order. Batching
+            lets the caller embed all sentences in a handful of requests
+            rather than one per sentence.
         threshold: Cosine similarity threshold below which a new chunk
             starts. Lower values create larger chunks. Defaults to 0.7.
         min_chunk_size: Minimum number of characters per chunk. Sentences
             will be combined until this threshold is met. Defaults to 100.
-            
+
     Returns:
         A list of text chunks, each representing a semantically coherent
         topic or section.
-        
+
     Raises:
         ValueError: If text is empty.
-        
+
     Example:
-        def get_embedding(text):
-            return ollama.embeddings(model="nomic-embed-text", prompt=text)
-        
-        chunks = semantic_chunking(document_text, get_embedding)
+        chunks = semantic_chunking(document_text, engine.get_embeddings)
         print(f"Created {len(chunks)} semantic chunks")
     """
     if not text or not text.strip():
         raise ValueError("Cannot chunk empty text")
     
-    # Split into sentences (simple approach using period + space)
-    # A more robust approach would use nltk or spacy
-    sentences = [s.strip() for s in text.split(". ") if s.strip()]
+    # Split into sentences at punctuation-aware boundaries
+    sentences = [s.strip() for s in _SENT_RE.split(text) if s.strip()]
     
     if len(sentences) <= 1:
         return [text]
     
-    # Generate embeddings for all sentences
-    embeddings = [get_embedding_fn(s) for s in sentences]
-    
+    # Embed all sentences in one batched call
+    embeddings = get_embeddings_fn(sentences)
+
+    # Compute all consecutive-sentence similarities in one vectorized
+    # pass: normalize the embedding matrix, then take the row-wise dot
+    # product of adjacent rows (cosine similarity on unit vectors)
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+    similarities = np.einsum("ij,ij->i", matrix[:-1], matrix[1:])
+
     # Build chunks based on semantic similarity
     chunks = []
     current_chunk = [sentences[0]]
     current_size = len(sentences[0])
-    
+
     for i in range(1, len(sentences)):
-        # Calculate similarity between consecutive sentences
-        similarity = cosine_similarity(
-            [embeddings[i - 1]], 
-            [embeddings[i]]
-        )[0][0]
-        
+        similarity = similarities[i - 1]
+
         # Check if we should start a new chunk
         if similarity < threshold and current_size >= min_chunk_size:
             # Topic shift detected - finalize current chunk
-            chunks.append(". ".join(current_chunk) + ".")
+            chunks.append(" ".join(current_chunk))
             current_chunk = [sentences[i]]
             current_size = len(sentences[i])
         else:
             # Continue current chunk
             current_chunk.append(sentences[i])
             current_size += len(sentences[i])
-    
+
     # Add final chunk
     if current_chunk:
-        final_text = ". ".join(current_chunk)
-        if not final_text.endswith("."):
-            final_text += "."
-        chunks.append(final_text)
-    
+        chunks.append(" ".join(current_chunk))
+
     return chunks
 
 
@@ -192,22 +231,34 @@ def simple_chunking(
     """
     if not text:
         return []
-    
+
+    # Locate every ". " boundary once, up front, instead of rescanning
+    # each window with rfind. For ASCII text a vectorized byte comparison
+    # finds all boundaries in one pass; byte offsets equal string offsets
+    # there, so the fallback regex pass only runs for non-ASCII text.
+    if text.isascii():
+        buf = np.frombuffer(text.encode(), dtype=np.uint8)
+        boundaries = np.where((buf[:-1] == ord(".")) & (buf[1:] == ord(" ")))[0]
+    else:
+        boundaries = np.fromiter(
+            (m.start() for m in re.finditer(r"\. ", text)), dtype=np.int64
+        )
+
     chunks = []
     start = 0
-    
-    while start < len(text):
+    n = len(text)
+
+    while start < n:
         end = start + chunk_size
-        chunk = text[start:end]
-        
-        # Try to break at a sentence boundary
-        if end < len(text):
-            last_period = chunk.rfind(". ")
-            if last_period > chunk_size // 2:
-                end = start + last_period + 2
-                chunk = text[start:end]
-        
-        chunks.append(chunk.strip())
+
+        # Snap the end to the last sentence boundary in the window,
+        # provided the chunk stays at least half full
+        if end < n and boundaries.size:
+            idx = int(np.searchsorted(boundaries, end - 2, side="right")) - 1
+            if idx >= 0 and boundaries[idx] - start > chunk_size // 2:
+                end = int(boundaries[idx]) + 2
+
+        chunks.append(text[start:end].strip())
         start = end - overlap
-    
+
     return chunks
@@ -30,7 +30,9 @@ Typical usage example:
         token = create_access_token(data={"sub": "admin"})
 """
 
+import functools
 import os
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -54,6 +56,12 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
 # Bearer token security scheme
 _bearer_scheme = HTTPBearer(auto_error=False)
 
+# bcrypt cost factor. The default of 12 costs ~250ms per verify, which
+# dominates login and token issuance latency. For a single-admin local
+# install, cost 10 (~60ms) is still a strong work factor; existing
+# hashes verify unchanged since bcrypt embeds the cost in the hash.
+_BCRYPT_ROUNDS = 10
+
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt.
@@ -68,7 +76,7 @@ def hash_password(password: str) -> str:
         hashed = hash_password("mysecretpassword")
     """
     pwd_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(pwd_bytes, salt)
     return hashed.decode('utf-8')
 
@@ -143,6 +151,29 @@ def verify_token(token: str) -> Optional[dict]:
         return None
 
 
+@functools.lru_cache(maxsize=1024)
+def _verify_token_cached(token: str) -> Optional[tuple[Optional[str], float]]:
+    """Verify a token once and cache the (subject, expiry) result.
+
+    Signature verification recomputes an HMAC over the token on every
+    call; for repeated requests with the same bearer token this is pure
+    repeat work. Expiry is returned rather than enforced here so callers
+    can re-check it cheaply on every request, which keeps cached entries
+    from outliving their tokens.
+
+    Args:
+        token: The JWT token string to verify.
+
+    Returns:
+        A (subject, expiry timestamp) tuple if the signature is valid,
+        None otherwise.
+    """
+    payload = verify_token(token)
+    if payload is None:
+        return None
+    return (payload.get("sub"), float(payload.get("exp", 0)))
+
+
 def setup_admin(password: str) -> bool:
     """Create the initial admin account.
     
@@ -230,13 +261,13 @@ async def get_current_admin(
         raise credentials_exception
     
     token = credentials.credentials
-    payload = verify_token(token)
-    
-    if payload is None:
+    result = _verify_token_cached(token)
+
+    if result is None:
         raise credentials_exception
-    
-    subject = payload.get("sub")
-    if subject != "admin":
+
+    subject, expires_at = result
+    if subject != "admin" or expires_at <= time.time():
         raise credentials_exception
-    
+
     return subject
@@ -23,22 +23,36 @@ To run the server:
 Endpoints:
     GET  /health        - Health check
     POST /ingest        - Upload and process documents
+    POST /ingest/batch  - Upload and process several PDFs at once
     POST /query         - Ask questions about documents
+    POST /query/stream  - Ask questions, streaming the answer via SSE
     POST /admin/setup   - Create admin account (first run)
     POST /admin/login   - Authenticate and get JWT
     GET  /admin/config  - Get current settings
     POST /admin/config  - Update settings
 """
 
-from typing import Any, Optional
+import asyncio
+import codecs
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import tempfile
+from typing import Any, Iterator, Optional
 
 from fastapi import Depends, FastAPI, File, HTTPException, UploadFile, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from backend.core.database import admin_exists, load_config, save_config
 from backend.core.engine import LocoEngine
-from backend.core.processor import extract_text_from_pdf, semantic_chunking
+from backend.core.pipeline import IngestionPipeline
+from backend.core.processor import extract_text_from_pdf_path, semantic_chunking
 from backend.core.security import (
     authenticate_admin,
     get_current_admin,
@@ -48,11 +62,27 @@ from backend.core.security import (
 # Application version
 __version__ = "1.0.0"
 
+# Route log records through an in-memory queue drained by a background
+# thread: emitting a record is a lock-free enqueue, and the handler's
+# stream I/O happens off the event loop
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler()
+)
+_log_listener.start()
+logging.basicConfig(
+    level=logging.WARNING,
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="LOCO RAG Engine",
     description="Local-Only Contextual Orchestration - A private RAG system",
     version=__version__,
+    # Serialize responses with orjson (C-backed) instead of stdlib json;
+    # /query payloads carry chunk text, where this is measurable
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS for frontend access
@@ -64,10 +94,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (query answers with chunk text, document
+# listings). Level 5 trades a little ratio for much lower CPU than the
+# default 9; responses under 1 KiB are sent as-is since compression
+# overhead outweighs the savings there. SSE streams are not buffered by
+# this middleware, so /query/stream keeps its token-at-a-time latency.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Initialize the RAG engine
 engine = LocoEngine()
 
 
+@app.on_event("startup")
+async def warm_models() -> None:
+    """Warm the Ollama models when the server starts.
+
+    Loading a model into memory takes seconds; doing it here means the
+    first user request doesn't pay that cost. Warmup runs in a worker
+    thread and failures are logged rather than raised, so the API still
+    comes up if Ollama isn't running yet.
+    """
+    try:
+        await asyncio.to_thread(engine.warm_up)
+    except Exception as e:
+        print(f"Model warmup skipped: {e}")
+
+
+@app.on_event("shutdown")
+async def stop_log_listener() -> None:
+    """Flush queued log records before the process exits."""
+    _log_listener.stop()
+
+
 # ============================================================================
 # Request/Response Models
 # ============================================================================
@@ -75,40 +133,40 @@ engine = LocoEngine()
 
 class QueryRequest(BaseModel):
     """Request model for the query endpoint."""
-    
+
     query: str = Field(..., description="The question to ask")
     top_k: Optional[int] = Field(None, ge=1, le=10, description="Number of sources")
 
 
 class QueryResponse(BaseModel):
     """Response model for the query endpoint."""
-    
+
     answer: str
     references: list[dict[str, Any]]
 
 
 class AdminSetupRequest(BaseModel):
     """Request model for admin account setup."""
-    
+
     password: str = Field(..., min_length=8, description="Admin password")
 
 
 class AdminLoginRequest(BaseModel):
     """Request model for admin login."""
-    
+
     password: str
 
 
 class LoginResponse(BaseModel):
     """Response model for login endpoint."""
-    
+
     access_token: str
     token_type: str = "bearer"
 
 
 class ConfigRequest(BaseModel):
     """Request model for configuration updates."""
-    
+
     model: Optional[str] = None
     temperature: Optional[float] = Field(None, ge=0.0, le=2.0)
     top_k: Optional[int] = Field(None, ge=1, le=10)
@@ -116,7 +174,7 @@ class ConfigRequest(BaseModel):
 
 class HealthResponse(BaseModel):
     """Response model for health check."""
-    
+
     status: str
     version: str
     documents: int
@@ -129,21 +187,63 @@ class HealthResponse(BaseModel):
 
 
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check() -> HealthResponse:
+async def health_check() -> ORJSONResponse:
     """Check the health status of the API.
-    
+
     Returns basic information about the server status, version,
     document count, and whether admin setup is complete.
-    
+
+    The response is built directly so FastAPI doesn't re-validate the
+    payload against HealthResponse; the model still documents the
+    schema in OpenAPI.
+
+    Returns:
+        ORJSONResponse with status information.
+    """
+    return ORJSONResponse({
+        "status": "healthy",
+        "version": __version__,
+        "documents": engine.get_document_count(),
+        "admin_setup": admin_exists(),
+    })
+
+
+def _spool_upload(file: UploadFile) -> str:
+    """Copy an upload to a temporary file in 1 MiB chunks.
+
+    Args:
+        file: The uploaded file to spool.
+
+    Returns:
+        Path to the temporary file; the caller is responsible for
+        deleting it.
+    """
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        shutil.copyfileobj(file.file, tmp, length=1 << 20)
+        return tmp.name
+
+
+def _decode_text_upload(file: UploadFile) -> str:
+    """Decode a text upload incrementally in 1 MiB chunks.
+
+    Args:
+        file: The uploaded file to decode.
+
     Returns:
-        HealthResponse with status information.
+        The decoded text content.
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid UTF-8.
     """
-    return HealthResponse(
-        status="healthy",
-        version=__version__,
-        documents=engine.get_document_count(),
-        admin_setup=admin_exists(),
-    )
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parts = []
+    while True:
+        chunk = file.file.read(1 << 20)
+        if not chunk:
+            break
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
 
 
 @app.post("/ingest", tags=["Documents"])
@@ -164,18 +264,24 @@ async def ingest_document(file: UploadFile = File(...)) -> dict[str, Any]:
         HTTPException: 500 if processing fails.
     """
     filename = file.filename or "unknown"
-    content = await file.read()
-    
-    # Determine file type and extract text
+
+    # Determine file type and extract text. Uploads are streamed in
+    # 1 MiB chunks rather than buffered whole in memory, and extraction,
+    # chunking, and ingestion run in worker threads to keep the event
+    # loop serving other requests.
     if filename.lower().endswith(".pdf"):
+        tmp_path = await asyncio.to_thread(_spool_upload, file)
         try:
-            pages = extract_text_from_pdf(content)
+            pages = await asyncio.to_thread(extract_text_from_pdf_path, tmp_path)
             full_text = "\n\n".join([p["text"] for p in pages])
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
+        finally:
+            await asyncio.to_thread(os.unlink, tmp_path)
     elif filename.lower().endswith(".txt"):
+        pages = []
         try:
-            full_text = content.decode("utf-8")
+            full_text = await asyncio.to_thread(_decode_text_upload, file)
         except UnicodeDecodeError:
             raise HTTPException(status_code=400, detail="Invalid text encoding")
     else:
@@ -184,9 +290,25 @@ async def ingest_document(file: UploadFile = File(...)) -> dict[str, Any]:
             detail="Unsupported file type. Please upload PDF or TXT files."
         )
     
-    # Perform semantic chunking
+    # Perform semantic chunking. Multi-page PDFs are chunked per page,
+    # with pages fanned out across worker threads: each page's embedding
+    # requests are network-bound, so running pages concurrently overlaps
+    # their Ollama round-trips instead of serializing them.
     try:
-        chunks = semantic_chunking(full_text, engine.get_embedding)
+        if filename.lower().endswith(".pdf") and len(pages) > 1:
+            per_page = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        semantic_chunking, p["text"], engine.get_embeddings
+                    )
+                    for p in pages
+                )
+            )
+            chunks = [chunk for page_chunks in per_page for chunk in page_chunks]
+        else:
+            chunks = await asyncio.to_thread(
+                semantic_chunking, full_text, engine.get_embeddings
+            )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -195,7 +317,7 @@ async def ingest_document(file: UploadFile = File(...)) -> dict[str, Any]:
     # Ingest into vector database
     try:
         metadata = {"filename": filename}
-        count = engine.ingest(chunks, metadata)
+        count = await asyncio.to_thread(engine.ingest, chunks, metadata)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Ingestion failed: {e}")
     
@@ -207,8 +329,52 @@ async def ingest_document(file: UploadFile = File(...)) -> dict[str, Any]:
     }
 
 
+@app.post("/ingest/batch", tags=["Documents"])
+async def ingest_documents(files: list[UploadFile] = File(...)) -> dict[str, Any]:
+    """Upload and process several PDF documents in one request.
+
+    Runs the staged ingestion pipeline, which overlaps each document's
+    text extraction, embedding, and database writes instead of handling
+    the files strictly one after another.
+
+    Args:
+        files: The uploaded PDF files.
+
+    Returns:
+        Dictionary with success status and total chunk count.
+
+    Raises:
+        HTTPException: 400 if a file is not a PDF or cannot be parsed.
+        HTTPException: 500 if processing fails.
+    """
+    documents: list[tuple[str, bytes]] = []
+    for file in files:
+        filename = file.filename or "unknown"
+        if not filename.lower().endswith(".pdf"):
+            raise HTTPException(
+                status_code=400,
+                detail="Batch ingestion supports PDF files only.",
+            )
+        documents.append((filename, await asyncio.to_thread(file.file.read)))
+
+    pipeline = IngestionPipeline(engine)
+    try:
+        count = await pipeline.run(documents)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Ingestion failed: {e}")
+
+    return {
+        "success": True,
+        "files_processed": len(documents),
+        "chunks_processed": count,
+        "message": "Documents ingested successfully",
+    }
+
+
 @app.post("/query", response_model=QueryResponse, tags=["Query"])
-async def query_documents(request: QueryRequest) -> QueryResponse:
+async def query_documents(request: QueryRequest) -> ORJSONResponse:
     """Ask a question about the ingested documents.
     
     Performs semantic search to find relevant document chunks,
@@ -218,23 +384,56 @@ async def query_documents(request: QueryRequest) -> QueryResponse:
         request: QueryRequest with the question and optional top_k.
         
     Returns:
-        QueryResponse with the answer and source references.
-        
+        ORJSONResponse with the answer and source references (documented
+        by QueryResponse in OpenAPI; built directly to skip the
+        duplicate response-model validation pass).
+
     Raises:
         HTTPException: 400 if no documents are ingested.
         HTTPException: 500 if query processing fails.
     """
     try:
-        result = engine.query(request.query, request.top_k)
+        # engine.query blocks on embedding, search, and LLM generation
+        result = await asyncio.to_thread(engine.query, request.query, request.top_k)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Query failed: {e}")
-    
-    return QueryResponse(
-        answer=result["answer"],
-        references=result["references"],
-    )
+
+    return ORJSONResponse({
+        "answer": result["answer"],
+        "references": result["references"],
+    })
+
+
+@app.post("/query/stream", tags=["Query"])
+async def query_documents_stream(request: QueryRequest) -> StreamingResponse:
+    """Ask a question and stream the answer as it is generated.
+
+    Performs the same retrieval as /query, but returns the answer as
+    Server-Sent Events so the client can render tokens as soon as the
+    LLM produces them instead of waiting for the full response. The
+    first event carries the source references; subsequent events each
+    carry one answer token.
+
+    Args:
+        request: QueryRequest with the question and optional top_k.
+
+    Returns:
+        StreamingResponse with text/event-stream framing. Each event's
+        data is a JSON object with either a 'references', 'token', or
+        'error' key.
+    """
+    def event_stream() -> Iterator[str]:
+        try:
+            for event in engine.query_stream(request.query, request.top_k):
+                yield f"data: {json.dumps(event)}\n\n"
+        except ValueError as e:
+            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+        except Exception as e:
+            yield f"data: {json.dumps({'error': f'Query failed: {e}'})}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
 # ============================================================================
@@ -269,14 +468,15 @@ async def admin_setup(request: AdminSetupRequest) -> dict[str, Any]:
 
 
 @app.post("/admin/login", response_model=LoginResponse, tags=["Admin"])
-async def admin_login(request: AdminLoginRequest) -> LoginResponse:
+async def admin_login(request: AdminLoginRequest) -> ORJSONResponse:
     """Authenticate and receive an access token.
     
     Args:
         request: AdminLoginRequest with the admin password.
         
     Returns:
-        LoginResponse with the JWT access token.
+        ORJSONResponse with the JWT access token (documented by
+        LoginResponse in OpenAPI).
         
     Raises:
         HTTPException: 401 if authentication fails.
@@ -296,7 +496,7 @@ async def admin_login(request: AdminLoginRequest) -> LoginResponse:
             detail="Invalid password",
         )
     
-    return LoginResponse(access_token=token)
+    return ORJSONResponse({"access_token": token, "token_type": "bearer"})
 
 
 @app.get("/admin/documents", tags=["Admin"])
@@ -380,9 +580,9 @@ async def update_config(
         config["top_k"] = request.top_k
     
     save_config(config)
-    
-    # Reload engine config
-    engine.config = load_config()
+
+    # Apply the dict we just saved; no need to re-read it from disk
+    engine.apply_config(config)
     
     return {
         "success": True,
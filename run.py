@@ -32,6 +32,7 @@ Options:
     --skip-setup      Skip dependency installation
 """
 
+import concurrent.futures
 import os
 import platform
 import subprocess
@@ -125,9 +126,19 @@ def check_models() -> bool:
         print("   ❌ Could not list models. Is Ollama running?")
         return False
     
+    # Parse the listing once into a set of base model names (the first
+    # column, with any ":tag" suffix removed). Substring checks against
+    # the raw output would false-positive, e.g. "llama3" matching
+    # "llama3.2".
+    installed = {
+        line.split()[0].split(":")[0]
+        for line in output.splitlines()[1:]
+        if line.strip()
+    }
+
     missing_models = []
     for model in OLLAMA_MODELS:
-        if model in output:
+        if model in installed:
             print(f"   ✅ Model found: {model}")
         else:
             print(f"   ⚠️  Model missing: {model}")
@@ -198,10 +209,16 @@ def setup_backend(project_root: Path) -> bool:
 
 def start_backend(project_root: Path) -> subprocess.Popen:
     """Start the FastAPI backend server.
-    
+
+    Runs one uvicorn worker per CPU core (minimum 2) so CPU-heavy work
+    like chunking doesn't serialize behind a single process's GIL. Set
+    the LOCO_WORKERS environment variable to override the count. Note
+    that each worker creates its own LocoEngine (and in-memory caches);
+    shared state lives on disk in LanceDB and SQLite.
+
     Args:
         project_root: Path to the project root directory.
-        
+
     Returns:
         The subprocess.Popen object for the backend process.
     """
@@ -215,15 +232,27 @@ def start_backend(project_root: Path) -> subprocess.Popen:
         python_exe = venv_path / "bin" / "python"
     
     # Start uvicorn
-    backend_proc = subprocess.Popen(
-        [
-            str(python_exe), "-m", "uvicorn",
-            "backend.main:app",
-            "--host", "0.0.0.0",
-            "--port", str(BACKEND_PORT),
-        ],
-        cwd=project_root,
-    )
+    uvicorn_args = [
+        str(python_exe), "-m", "uvicorn",
+        "backend.main:app",
+        "--host", "0.0.0.0",
+        "--port", str(BACKEND_PORT),
+    ]
+
+    # Use the C event loop and HTTP parser where available (uvloop does
+    # not support Windows); both ship with uvicorn[standard]
+    if platform.system() != "Windows":
+        uvicorn_args += ["--loop", "uvloop", "--http", "httptools"]
+
+    # Scale across cores; LOCO_WORKERS overrides the default
+    workers = int(os.getenv("LOCO_WORKERS", max(2, os.cpu_count() or 2)))
+    uvicorn_args += ["--workers", str(workers)]
+
+    # Access logging formats and writes a line per request on the hot
+    # path; disable it and keep only warnings and errors
+    uvicorn_args += ["--no-access-log", "--log-level", "warning"]
+
+    backend_proc = subprocess.Popen(uvicorn_args, cwd=project_root)
     
     print(f"   ✅ Backend starting at http://localhost:{BACKEND_PORT}")
     return backend_proc
@@ -293,14 +322,26 @@ def main() -> int:
     # Check prerequisites
     if not check_ollama():
         return 1
-    
-    if not check_models():
+
+    # Model pulls (network-bound) and backend setup (pip install) don't
+    # depend on each other, so run them concurrently; on a fresh machine
+    # this overlaps gigabyte model downloads with venv creation instead
+    # of serializing them
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        models_future = executor.submit(check_models)
+        setup_future = (
+            executor.submit(setup_backend, project_root)
+            if not skip_setup
+            else None
+        )
+        futures = [f for f in (models_future, setup_future) if f is not None]
+        concurrent.futures.wait(futures)
+
+    if not models_future.result():
+        return 1
+
+    if setup_future is not None and not setup_future.result():
         return 1
-    
-    # Setup backend
-    if not skip_setup:
-        if not setup_backend(project_root):
-            return 1
     
     # Start services
     backend_proc = start_backend(project_root)